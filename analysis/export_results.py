@@ -16,8 +16,12 @@ from sqlalchemy import create_engine
 # In production, you would execute SQL queries and export results
 
 # Load the dataset (generated from SQL queries)
-df = pd.read_csv('data/helpdesk_process_log.csv')
-df['Timestamp'] = pd.to_datetime(df['Timestamp'])
+# Low-cardinality text columns are loaded as categoricals to keep memory small
+df = pd.read_csv(
+    'data/helpdesk_process_log.csv',
+    dtype={col: 'category' for col in ['Case_ID', 'Activity', 'Priority', 'Category', 'Agent']},
+    parse_dates=['Timestamp']
+)
 
 print(f"Loaded {len(df)} events for {df['Case_ID'].nunique()} tickets")
 
@@ -14,13 +14,14 @@ WITH stage_transitions AS (
     SELECT 
         case_id,
         activity AS from_stage,
-        LEAD(activity) OVER (PARTITION BY case_id ORDER BY timestamp) AS to_stage,
+        LEAD(activity) OVER w AS to_stage,
         timestamp AS start_time,
-        LEAD(timestamp) OVER (PARTITION BY case_id ORDER BY timestamp) AS end_time,
+        LEAD(timestamp) OVER w AS end_time,
         priority,
         category,
         agent
     FROM helpdesk_events
+    WINDOW w AS (PARTITION BY case_id ORDER BY timestamp)  -- Shared window: one sort per query
 )
 SELECT 
     from_stage,
@@ -47,26 +48,26 @@ WITH stage_durations AS (
     SELECT 
         case_id,
         activity AS from_stage,
-        LEAD(timestamp) OVER (PARTITION BY case_id ORDER BY timestamp) - timestamp AS duration,
+        EXTRACT(EPOCH FROM (LEAD(timestamp) OVER (PARTITION BY case_id ORDER BY timestamp) - timestamp)) / 3600 AS duration_hours,  -- Convert to hours once
         priority,
         category
     FROM helpdesk_events
 )
 SELECT 
     from_stage,
-    ROUND(AVG(EXTRACT(EPOCH FROM duration) / 3600)::numeric, 2) AS avg_wait_hours,
-    ROUND(PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY EXTRACT(EPOCH FROM duration) / 3600)::numeric, 2) AS median_hours,
+    ROUND(AVG(duration_hours)::numeric, 2) AS avg_wait_hours,
+    ROUND(PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY duration_hours)::numeric, 2) AS median_hours,
     COUNT(*) AS affected_tickets,
     CASE 
-        WHEN AVG(EXTRACT(EPOCH FROM duration) / 3600) > 40 THEN 'CRITICAL'
-        WHEN AVG(EXTRACT(EPOCH FROM duration) / 3600) > 20 THEN 'HIGH'
-        WHEN AVG(EXTRACT(EPOCH FROM duration) / 3600) > 10 THEN 'MODERATE'
+        WHEN AVG(duration_hours) > 40 THEN 'CRITICAL'
+        WHEN AVG(duration_hours) > 20 THEN 'HIGH'
+        WHEN AVG(duration_hours) > 10 THEN 'MODERATE'
         ELSE 'NORMAL'
     END AS severity_level
 FROM stage_durations
-WHERE duration IS NOT NULL
+WHERE duration_hours IS NOT NULL
 GROUP BY from_stage
-HAVING AVG(EXTRACT(EPOCH FROM duration) / 3600) > 5  -- Only stages with >5 hour average
+HAVING AVG(duration_hours) > 5  -- Only stages with >5 hour average
 ORDER BY avg_wait_hours DESC;
 
 -- Expected Output: Ranked list of bottleneck stages with severity flags
@@ -169,10 +170,11 @@ WITH customer_waits AS (
         case_id,
         activity,
         timestamp,
-        LEAD(timestamp) OVER (PARTITION BY case_id ORDER BY timestamp) AS next_timestamp,
-        EXTRACT(EPOCH FROM (LEAD(timestamp) OVER (PARTITION BY case_id ORDER BY timestamp) - timestamp)) / 3600 AS wait_hours
+        LEAD(timestamp) OVER w AS next_timestamp,
+        EXTRACT(EPOCH FROM (LEAD(timestamp) OVER w - timestamp)) / 3600 AS wait_hours
     FROM helpdesk_events
     WHERE activity = 'Awaiting Customer Response'
+    WINDOW w AS (PARTITION BY case_id ORDER BY timestamp)
 )
 SELECT 
     COUNT(DISTINCT case_id) AS tickets_requiring_customer_input,